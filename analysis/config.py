@@ -4,6 +4,7 @@ Update these values to match your PostgreSQL setup
 """
 
 import os
+from urllib.parse import quote
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -16,3 +17,8 @@ DB_CONFIG = {
     'port': os.getenv('DB_PORT', '5432')
 }
 
+
+# Same settings as a libpq URI, for drivers that only take a connection string (ADBC)
+DB_URI = "postgresql://{user}:{password}@{host}:{port}/{database}".format(
+    **{key: quote(str(value), safe='') for key, value in DB_CONFIG.items()}
+)
@@ -0,0 +1,29 @@
+"""
+Shared PostgreSQL connection pool for the analysis scripts
+Connections stay open between queries instead of reconnecting each time
+"""
+
+import atexit
+from psycopg_pool import ConnectionPool
+
+from config import DB_URI
+
+# Enough connections for run_analysis.py's concurrent queries. Opened on first
+# use, so importing this module (e.g. in a plot worker process) doesn't connect.
+POOL = ConnectionPool(
+    DB_URI,
+    min_size=2,
+    max_size=8,
+    max_idle=60.0,
+    timeout=10.0,
+    open=False,
+)
+
+atexit.register(POOL.close)
+
+
+def get_connection():
+    """Borrow a pooled connection; use as a context manager to give it back"""
+    if POOL.closed:
+        POOL.open()
+    return POOL.connection()
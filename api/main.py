@@ -3,22 +3,30 @@ Jumper Media Analytics API
 FastAPI application for engagement analytics endpoints
 """
 
-from fastapi import FastAPI, HTTPException, Depends
+from fastapi import FastAPI, HTTPException, Depends, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, Response
 from pydantic import BaseModel
-from typing import Optional, List
-from datetime import datetime, timedelta
-import psycopg2
-from psycopg2.extras import RealDictCursor
+from typing import Optional, List, Union
+from datetime import date, datetime, time, timedelta, timezone
+import asyncpg
+import orjson
+import redis.asyncio as redis
+from redis.exceptions import RedisError
+import asyncio
+import logging
 import os
 from dotenv import load_dotenv
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 app = FastAPI(
     title="Jumper Media Analytics API",
     description="API for engagement analytics and trends",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
@@ -36,13 +44,292 @@ DB_CONFIG = {
     'database': os.getenv('DB_NAME', 'jumper_media'),
     'user': os.getenv('DB_USER', 'postgres'),
     'password': os.getenv('DB_PASSWORD', 'postgres'),
-    'port': os.getenv('DB_PORT', '5432')
+    'port': int(os.getenv('DB_PORT', '5432'))
+}
+
+
+# Connection pool bounds (override via environment)
+POOL_MIN_CONN = int(os.getenv('DB_POOL_MIN', '5'))
+POOL_MAX_CONN = int(os.getenv('DB_POOL_MAX', '30'))
+
+# How often the background task refreshes the materialized views (0 disables it)
+MV_REFRESH_SECONDS = int(os.getenv('MV_REFRESH_SECONDS', '300'))
+
+# Advisory lock key that elects the one worker refreshing the materialized views
+MV_REFRESH_LOCK_KEY = 815_000_001
+
+# Response cache (disabled when REDIS_URL is unset)
+REDIS_URL = os.getenv('REDIS_URL')
+CACHE_TTL_SECONDS = int(os.getenv('CACHE_TTL_SECONDS', '600'))
+
+# Session settings for every pooled connection: the endpoints run small
+# aggregations, so skip JIT compilation and keep one generic plan per statement
+SERVER_SETTINGS = {
+    'jit': 'off',
+    'plan_cache_mode': 'force_generic_plan',
+    'work_mem': os.getenv('DB_WORK_MEM', '32MB'),
+}
+
+# Materialized views the endpoints read from
+MATERIALIZED_VIEWS = ['daily_post_engagement', 'daily_author_engagement', 'daily_global_engagement']
+
+
+# SQL for the hot endpoints, prepared once per pooled connection
+
+# Post title plus both periods in one round-trip
+POST_TRENDS_QUERY = """
+    WITH post AS (
+        SELECT title FROM posts WHERE post_id = $1
+    ),
+    daily AS (
+        SELECT 
+            CASE WHEN engagement_date >= $2 THEN 'current' ELSE 'previous' END AS period,
+            engagement_date AS date,
+            COALESCE(SUM(engagement_count) FILTER (WHERE type = 'view'), 0)::INTEGER AS views,
+            COALESCE(SUM(engagement_count) FILTER (WHERE type = 'like'), 0)::INTEGER AS likes,
+            COALESCE(SUM(engagement_count) FILTER (WHERE type = 'comment'), 0)::INTEGER AS comments,
+            COALESCE(SUM(engagement_count) FILTER (WHERE type = 'share'), 0)::INTEGER AS shares,
+            SUM(engagement_count)::INTEGER AS total
+        FROM daily_post_engagement
+        WHERE post_id = $1 
+          AND engagement_date >= $3
+        GROUP BY engagement_date
+    )
+    SELECT 
+        post.title,
+        daily.*,
+        SUM(daily.total) OVER (PARTITION BY daily.period)::INTEGER AS period_total
+    FROM post
+    LEFT JOIN daily ON TRUE
+    ORDER BY daily.date
+"""
+
+# Author name plus both periods in one round-trip
+AUTHOR_TRENDS_QUERY = """
+    WITH author AS (
+        SELECT name FROM authors WHERE author_id = $1
+    ),
+    daily AS (
+        SELECT 
+            CASE WHEN engagement_date >= $2 THEN 'current' ELSE 'previous' END AS period,
+            engagement_date AS date,
+            COALESCE(SUM(engagement_count) FILTER (WHERE type = 'view'), 0)::INTEGER AS views,
+            COALESCE(SUM(engagement_count) FILTER (WHERE type = 'like'), 0)::INTEGER AS likes,
+            COALESCE(SUM(engagement_count) FILTER (WHERE type = 'comment'), 0)::INTEGER AS comments,
+            COALESCE(SUM(engagement_count) FILTER (WHERE type = 'share'), 0)::INTEGER AS shares,
+            SUM(engagement_count)::INTEGER AS total
+        FROM daily_author_engagement
+        WHERE author_id = $1 
+          AND engagement_date >= $3
+        GROUP BY engagement_date
+    )
+    SELECT 
+        author.name,
+        daily.*,
+        SUM(daily.total) OVER (PARTITION BY daily.period)::INTEGER AS period_total
+    FROM author
+    LEFT JOIN daily ON TRUE
+    ORDER BY daily.date
+"""
+
+# Platform totals: posts published since $1, engagements since $2 (from the daily rollup)
+SUMMARY_QUERY = """
+    SELECT 
+        (SELECT COUNT(*) FROM authors)::INTEGER AS total_authors,
+        (SELECT COUNT(*) FROM posts WHERE publish_timestamp >= $1)::INTEGER AS total_posts,
+        (SELECT COUNT(DISTINCT post_id) FROM daily_post_engagement
+         WHERE engagement_date >= $2)::INTEGER AS engaged_posts,
+        g.total_engagements,
+        g.total_views,
+        g.total_likes,
+        g.total_comments,
+        g.total_shares
+    FROM (
+        SELECT 
+            COALESCE(SUM(total), 0)::INTEGER AS total_engagements,
+            COALESCE(SUM(views), 0)::INTEGER AS total_views,
+            COALESCE(SUM(likes), 0)::INTEGER AS total_likes,
+            COALESCE(SUM(comments), 0)::INTEGER AS total_comments,
+            COALESCE(SUM(shares), 0)::INTEGER AS total_shares
+        FROM daily_global_engagement
+        WHERE engagement_date >= $2
+    ) g
+"""
+
+PREPARED_QUERIES = {
+    'post_trends': POST_TRENDS_QUERY,
+    'author_trends': AUTHOR_TRENDS_QUERY,
+    'summary': SUMMARY_QUERY,
 }
 
 
-def get_db_connection():
-    """Get database connection"""
-    return psycopg2.connect(**DB_CONFIG)
+class PreparedConnection(asyncpg.Connection):
+    """asyncpg connection that keeps the API's hot statements prepared"""
+
+    async def prepare_statements(self):
+        """Parse and plan each hot query once for the life of the connection"""
+        self.statements = {
+            name: await self.prepare(query)
+            for name, query in PREPARED_QUERIES.items()
+        }
+
+
+async def init_connection(conn):
+    """Pool init hook: runs once for every new connection"""
+    await conn.prepare_statements()
+
+
+@app.on_event("startup")
+async def open_pool():
+    """Create the process-wide asyncpg connection pool"""
+    app.state.pool = await asyncpg.create_pool(
+        min_size=POOL_MIN_CONN,
+        max_size=POOL_MAX_CONN,
+        connection_class=PreparedConnection,
+        init=init_connection,
+        server_settings=SERVER_SETTINGS,
+        **DB_CONFIG
+    )
+    app.state.redis = redis.from_url(REDIS_URL) if REDIS_URL else None
+    app.state.refresh_task = None
+    if MV_REFRESH_SECONDS > 0:
+        app.state.refresh_task = asyncio.create_task(refresh_materialized_views())
+
+
+@app.on_event("shutdown")
+async def close_pool():
+    """Stop the refresh task and close all pooled connections"""
+    if app.state.refresh_task is not None:
+        app.state.refresh_task.cancel()
+        # Let its finally run, so the lock connection is closed before the loop stops
+        try:
+            await app.state.refresh_task
+        except asyncio.CancelledError:
+            pass
+    if app.state.redis is not None:
+        await app.state.redis.aclose()
+    await app.state.pool.close()
+
+
+async def refresh_materialized_views():
+    """
+    Periodically refresh the daily aggregates without blocking readers.
+    Only the worker holding the refresh advisory lock does the work; the
+    others retry the lock every interval and take over if the holder exits.
+    """
+    # Session-level lock, so it lives on its own connection rather than a pooled one
+    lock_conn = None
+    try:
+        while True:
+            await asyncio.sleep(MV_REFRESH_SECONDS)
+            try:
+                if lock_conn is None or lock_conn.is_closed():
+                    lock_conn = await asyncpg.connect(**DB_CONFIG)
+                    if not await lock_conn.fetchval("SELECT pg_try_advisory_lock($1)", MV_REFRESH_LOCK_KEY):
+                        await lock_conn.close()
+                        lock_conn = None
+                        continue
+                for view in MATERIALIZED_VIEWS:
+                    await lock_conn.execute(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {view}")
+            except Exception:
+                logger.exception("Materialized view refresh failed")
+    finally:
+        # Closing the session releases the lock for another worker
+        if lock_conn is not None:
+            lock_conn.terminate()
+
+
+@app.exception_handler(asyncpg.PostgresError)
+async def database_error_handler(request: Request, exc: asyncpg.PostgresError):
+    """Turn database errors into a 500 without leaking driver details"""
+    logger.error("Database error on %s", request.url.path, exc_info=exc)
+    return ORJSONResponse(status_code=500, content={"detail": "Database error"})
+
+
+async def get_conn():
+    """Borrow a connection from the pool for the duration of a request"""
+    async with app.state.pool.acquire() as conn:
+        yield conn
+
+
+async def cache_get(key: str) -> Optional[bytes]:
+    """Look up a cached response; a Redis outage is treated as a miss"""
+    if app.state.redis is None:
+        return None
+    try:
+        return await app.state.redis.get(key)
+    except RedisError:
+        logger.warning("Redis unavailable, skipping cache lookup for %s", key)
+        return None
+
+
+async def cache_set(key: str, value: Union[str, bytes]):
+    """Store a serialized response for CACHE_TTL_SECONDS"""
+    if app.state.redis is None:
+        return
+    try:
+        await app.state.redis.setex(key, CACHE_TTL_SECONDS, value)
+    except RedisError:
+        logger.warning("Redis unavailable, not caching %s", key)
+
+
+def utc_today() -> date:
+    """
+    Current UTC day; every query window starts at a UTC midnight.
+    Timestamps are stored as naive UTC wall-clock times, so this matches engaged_date.
+    """
+    return datetime.now(timezone.utc).date()
+
+
+async def trend_response(statement: str, entity_id: int, current_start: date, previous_start: date,
+                         id_key: str, name_key: str, name_column: str, not_found: str, cache_key: str):
+    """
+    Fetch a trend (at most 2*days rows) and build the JSON body with orjson.
+    The connection goes back to the pool before the response is sent.
+    """
+    async with app.state.pool.acquire() as conn:
+        rows = await conn.statements[statement].fetch(entity_id, current_start, previous_start)
+    if not rows:
+        raise HTTPException(status_code=404, detail=not_found)
+    
+    # Split rows by period (an entity with no engagements comes back as one row with NULL period)
+    periods = {'current': [], 'previous': []}
+    for row in rows:
+        if row['period'] is not None:
+            periods[row['period']].append(row)
+    
+    # Period totals come precomputed from SQL on every row
+    totals = {period: period_rows[0]['period_total'] if period_rows else 0
+              for period, period_rows in periods.items()}
+    change_percent = 0.0
+    if totals['previous'] > 0:
+        change_percent = ((totals['current'] - totals['previous']) / totals['previous']) * 100
+    
+    # Rows are already typed by SQL, so serialize them directly instead of building models
+    trends = {
+        period: [
+            {
+                'date': row['date'],
+                'views': row['views'],
+                'likes': row['likes'],
+                'comments': row['comments'],
+                'shares': row['shares'],
+                'total': row['total'],
+            }
+            for row in period_rows
+        ]
+        for period, period_rows in periods.items()
+    }
+    
+    body = orjson.dumps({
+        id_key: entity_id,
+        name_key: rows[0][name_column],
+        'current_period': trends['current'],
+        'previous_period': trends['previous'],
+        'change_percent': round(change_percent, 2),
+    })
+    await cache_set(cache_key, body)
+    return Response(content=body, media_type="application/json")
 
 
 # Response Models
@@ -100,259 +387,93 @@ async def root():
 async def get_post_trends(post_id: int, days: int = 7):
     """
     Get engagement trends for a specific post.
-    Compares last N days (default 7) vs previous N days.
+    Compares last N days (default 7) vs previous N days, in UTC days (the
+    stored timestamps are UTC): the current period is today so far plus the
+    N-1 days before it, and the previous period is the N days before that.
+    Every request on the same day shares the same boundaries (and cache entry).
+    Reads from the daily_post_engagement materialized view.
+    Responses are cached in Redis for CACHE_TTL_SECONDS when REDIS_URL is set.
     """
-    conn = get_db_connection()
-    cursor = conn.cursor(cursor_factory=RealDictCursor)
+    # Daily buckets only change at midnight, so the day is part of the key
+    today = utc_today()
+    cache_key = f"trend:post:{post_id}:{days}:{today.isoformat()}"
+    cached = await cache_get(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
     
-    try:
-        # Get post title
-        cursor.execute("SELECT title FROM posts WHERE post_id = %s", (post_id,))
-        post = cursor.fetchone()
-        if not post:
-            raise HTTPException(status_code=404, detail="Post not found")
-        
-        post_title = post['title']
-        
-        # Current period (last N days)
-        current_start = datetime.now() - timedelta(days=days)
-        current_query = """
-        SELECT 
-            DATE(engaged_timestamp) AS date,
-            COUNT(*) FILTER (WHERE type = 'view') AS views,
-            COUNT(*) FILTER (WHERE type = 'like') AS likes,
-            COUNT(*) FILTER (WHERE type = 'comment') AS comments,
-            COUNT(*) FILTER (WHERE type = 'share') AS shares,
-            COUNT(*) AS total
-        FROM engagements
-        WHERE post_id = %s 
-          AND engaged_timestamp >= %s
-        GROUP BY DATE(engaged_timestamp)
-        ORDER BY date
-        """
-        cursor.execute(current_query, (post_id, current_start))
-        current_period = cursor.fetchall()
-        
-        # Previous period (N days before that)
-        previous_start = current_start - timedelta(days=days)
-        previous_query = """
-        SELECT 
-            DATE(engaged_timestamp) AS date,
-            COUNT(*) FILTER (WHERE type = 'view') AS views,
-            COUNT(*) FILTER (WHERE type = 'like') AS likes,
-            COUNT(*) FILTER (WHERE type = 'comment') AS comments,
-            COUNT(*) FILTER (WHERE type = 'share') AS shares,
-            COUNT(*) AS total
-        FROM engagements
-        WHERE post_id = %s 
-          AND engaged_timestamp >= %s 
-          AND engaged_timestamp < %s
-        GROUP BY DATE(engaged_timestamp)
-        ORDER BY date
-        """
-        cursor.execute(previous_query, (post_id, previous_start, current_start))
-        previous_period = cursor.fetchall()
-        
-        # Calculate total engagement for comparison
-        current_total = sum(row['total'] for row in current_period)
-        previous_total = sum(row['total'] for row in previous_period)
-        
-        change_percent = 0.0
-        if previous_total > 0:
-            change_percent = ((current_total - previous_total) / previous_total) * 100
-        
-        # Format response
-        current_trends = [
-            EngagementTrend(
-                date=str(row['date']),
-                views=row['views'],
-                likes=row['likes'],
-                comments=row['comments'],
-                shares=row['shares'],
-                total=row['total']
-            )
-            for row in current_period
-        ]
-        
-        previous_trends = [
-            EngagementTrend(
-                date=str(row['date']),
-                views=row['views'],
-                likes=row['likes'],
-                comments=row['comments'],
-                shares=row['shares'],
-                total=row['total']
-            )
-            for row in previous_period
-        ]
-        
-        return PostTrendsResponse(
-            post_id=post_id,
-            post_title=post_title,
-            current_period=current_trends,
-            previous_period=previous_trends,
-            change_percent=round(change_percent, 2)
-        )
-        
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        cursor.close()
-        conn.close()
+    # Both periods cover N dates: today plus the N-1 days before it, then the N days before that
+    current_start = today - timedelta(days=days - 1)
+    previous_start = current_start - timedelta(days=days)
+    
+    return await trend_response(
+        'post_trends', post_id, current_start, previous_start,
+        id_key='post_id', name_key='post_title', name_column='title',
+        not_found="Post not found", cache_key=cache_key
+    )
 
 
 @app.get("/api/engagement/trends/author/{author_id}", response_model=AuthorTrendsResponse)
 async def get_author_trends(author_id: int, days: int = 7):
     """
     Get engagement trends for a specific author.
-    Compares last N days (default 7) vs previous N days.
+    Compares last N days (default 7) vs previous N days, in UTC days (the
+    stored timestamps are UTC): the current period is today so far plus the
+    N-1 days before it, and the previous period is the N days before that.
+    Every request on the same day shares the same boundaries (and cache entry).
+    Reads from the daily_author_engagement materialized view.
+    Responses are cached in Redis for CACHE_TTL_SECONDS when REDIS_URL is set.
     """
-    conn = get_db_connection()
-    cursor = conn.cursor(cursor_factory=RealDictCursor)
+    # Daily buckets only change at midnight, so the day is part of the key
+    today = utc_today()
+    cache_key = f"trend:author:{author_id}:{days}:{today.isoformat()}"
+    cached = await cache_get(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
     
-    try:
-        # Get author name
-        cursor.execute("SELECT name FROM authors WHERE author_id = %s", (author_id,))
-        author = cursor.fetchone()
-        if not author:
-            raise HTTPException(status_code=404, detail="Author not found")
-        
-        author_name = author['name']
-        
-        # Current period (last N days)
-        current_start = datetime.now() - timedelta(days=days)
-        current_query = """
-        SELECT 
-            DATE(e.engaged_timestamp) AS date,
-            COUNT(*) FILTER (WHERE e.type = 'view') AS views,
-            COUNT(*) FILTER (WHERE e.type = 'like') AS likes,
-            COUNT(*) FILTER (WHERE e.type = 'comment') AS comments,
-            COUNT(*) FILTER (WHERE e.type = 'share') AS shares,
-            COUNT(*) AS total
-        FROM engagements e
-        JOIN posts p ON e.post_id = p.post_id
-        WHERE p.author_id = %s 
-          AND e.engaged_timestamp >= %s
-        GROUP BY DATE(e.engaged_timestamp)
-        ORDER BY date
-        """
-        cursor.execute(current_query, (author_id, current_start))
-        current_period = cursor.fetchall()
-        
-        # Previous period (N days before that)
-        previous_start = current_start - timedelta(days=days)
-        previous_query = """
-        SELECT 
-            DATE(e.engaged_timestamp) AS date,
-            COUNT(*) FILTER (WHERE e.type = 'view') AS views,
-            COUNT(*) FILTER (WHERE e.type = 'like') AS likes,
-            COUNT(*) FILTER (WHERE e.type = 'comment') AS comments,
-            COUNT(*) FILTER (WHERE e.type = 'share') AS shares,
-            COUNT(*) AS total
-        FROM engagements e
-        JOIN posts p ON e.post_id = p.post_id
-        WHERE p.author_id = %s 
-          AND e.engaged_timestamp >= %s 
-          AND e.engaged_timestamp < %s
-        GROUP BY DATE(e.engaged_timestamp)
-        ORDER BY date
-        """
-        cursor.execute(previous_query, (author_id, previous_start, current_start))
-        previous_period = cursor.fetchall()
-        
-        # Calculate total engagement for comparison
-        current_total = sum(row['total'] for row in current_period)
-        previous_total = sum(row['total'] for row in previous_period)
-        
-        change_percent = 0.0
-        if previous_total > 0:
-            change_percent = ((current_total - previous_total) / previous_total) * 100
-        
-        # Format response
-        current_trends = [
-            EngagementTrend(
-                date=str(row['date']),
-                views=row['views'],
-                likes=row['likes'],
-                comments=row['comments'],
-                shares=row['shares'],
-                total=row['total']
-            )
-            for row in current_period
-        ]
-        
-        previous_trends = [
-            EngagementTrend(
-                date=str(row['date']),
-                views=row['views'],
-                likes=row['likes'],
-                comments=row['comments'],
-                shares=row['shares'],
-                total=row['total']
-            )
-            for row in previous_period
-        ]
-        
-        return AuthorTrendsResponse(
-            author_id=author_id,
-            author_name=author_name,
-            current_period=current_trends,
-            previous_period=previous_trends,
-            change_percent=round(change_percent, 2)
-        )
-        
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        cursor.close()
-        conn.close()
+    # Both periods cover N dates: today plus the N-1 days before it, then the N days before that
+    current_start = today - timedelta(days=days - 1)
+    previous_start = current_start - timedelta(days=days)
+    
+    return await trend_response(
+        'author_trends', author_id, current_start, previous_start,
+        id_key='author_id', name_key='author_name', name_column='name',
+        not_found="Author not found", cache_key=cache_key
+    )
 
 
 @app.get("/api/analytics/summary", response_model=SummaryMetrics)
-async def get_analytics_summary(days: int = 30):
+async def get_analytics_summary(days: int = 30, conn=Depends(get_conn)):
     """
     Get overall analytics summary for the last N days (default 30).
+    Counts all authors, posts published in the window, and engagements
+    that happened in the window (from the daily_global_engagement rollup).
+    avg_engagement_per_post divides those engagements by the posts that
+    received any in the window. The window starts at UTC midnight N days
+    ago, matching the daily buckets (timestamps are stored in UTC).
     """
-    conn = get_db_connection()
-    cursor = conn.cursor(cursor_factory=RealDictCursor)
+    start_date = utc_today() - timedelta(days=days)
     
-    try:
-        start_date = datetime.now() - timedelta(days=days)
-        
-        query = """
-        SELECT 
-            COUNT(DISTINCT a.author_id) AS total_authors,
-            COUNT(DISTINCT p.post_id) AS total_posts,
-            COUNT(e.engagement_id) AS total_engagements,
-            COUNT(*) FILTER (WHERE e.type = 'view') AS total_views,
-            COUNT(*) FILTER (WHERE e.type = 'like') AS total_likes,
-            COUNT(*) FILTER (WHERE e.type = 'comment') AS total_comments,
-            COUNT(*) FILTER (WHERE e.type = 'share') AS total_shares,
-            ROUND(COUNT(e.engagement_id)::NUMERIC / NULLIF(COUNT(DISTINCT p.post_id), 0), 2) AS avg_engagement_per_post
-        FROM authors a
-        LEFT JOIN posts p ON a.author_id = p.author_id
-        LEFT JOIN engagements e ON p.post_id = e.post_id
-        WHERE p.publish_timestamp >= %s OR p.publish_timestamp IS NULL
-        """
-        cursor.execute(query, (start_date,))
-        result = cursor.fetchone()
-        
-        return SummaryMetrics(
-            total_authors=result['total_authors'] or 0,
-            total_posts=result['total_posts'] or 0,
-            total_engagements=result['total_engagements'] or 0,
-            total_views=result['total_views'] or 0,
-            total_likes=result['total_likes'] or 0,
-            total_comments=result['total_comments'] or 0,
-            total_shares=result['total_shares'] or 0,
-            avg_engagement_per_post=float(result['avg_engagement_per_post'] or 0)
-        )
-        
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        cursor.close()
-        conn.close()
+    result = await conn.statements['summary'].fetchrow(
+        datetime.combine(start_date, time.min), start_date
+    )
+    
+    # Average over the posts engaged with in the window, so the numerator and
+    # denominator cover the same posts (older posts still get engagements)
+    engaged_posts = result['engaged_posts']
+    avg_engagement_per_post = 0.0
+    if engaged_posts > 0:
+        avg_engagement_per_post = result['total_engagements'] / engaged_posts
+    
+    return SummaryMetrics(
+        total_authors=result['total_authors'],
+        total_posts=result['total_posts'],
+        total_engagements=result['total_engagements'],
+        total_views=result['total_views'],
+        total_likes=result['total_likes'],
+        total_comments=result['total_comments'],
+        total_shares=result['total_shares'],
+        avg_engagement_per_post=round(avg_engagement_per_post, 2)
+    )
 
 
 if __name__ == "__main__":
@@ -4,9 +4,14 @@ Generate larger synthetic dataset for performance testing and analysis.
 This script creates realistic data distributions for testing queries at scale.
 """
 
+import os
 import psycopg2
+from psycopg2.extras import execute_values
+from pgcopy import CopyManager
 import random
-from datetime import datetime, timedelta
+import numpy as np
+from datetime import datetime, timedelta, timezone
+from multiprocessing import Pool
 from faker import Faker
 
 # Configuration
@@ -23,11 +28,32 @@ NUM_POSTS = 10000
 NUM_ENGAGEMENTS = 100000
 NUM_USERS = 5000
 
+# Worker processes used to generate and load engagements in parallel
+NUM_WORKERS = os.cpu_count() or 4
+
+# Rows sent per multi-row INSERT statement
+PAGE_SIZE = 1000
+
+# Rows fetched per round-trip when streaming from server-side cursors
+FETCH_ITERSIZE = 2000
+
 # Categories and engagement patterns
 CATEGORIES = ['Tech', 'Lifestyle', 'Business', 'Health', 'Entertainment', 'Education']
 AUTHOR_CATEGORIES = ['Tech', 'Lifestyle', 'Business', 'Health', 'Entertainment']
 COUNTRIES = ['US', 'UK', 'CA', 'AU', 'DE', 'FR', 'JP', 'BR', 'IN', 'MX']
 USER_SEGMENTS = ['free', 'subscriber', 'trial', 'premium']
+ENGAGEMENT_TYPES = ['view', 'like', 'comment', 'share']
+
+# Sampling distributions, normalized once at import instead of per call
+# Publish hour of day (more posts during business hours)
+PUBLISH_HOUR_WEIGHTS = np.array([1, 1, 1, 1, 2, 3, 4, 5, 6, 7, 8, 7, 6, 5, 4, 3, 2, 2, 1, 1, 1, 1, 1, 1], dtype=float)
+PUBLISH_HOUR_P = PUBLISH_HOUR_WEIGHTS / PUBLISH_HOUR_WEIGHTS.sum()
+# Engagement type distribution (views are most common)
+ENGAGEMENT_TYPE_P = np.array([0.7, 0.2, 0.07, 0.03])
+# Hour-of-day jitter applied to engagement times, in hours
+HOUR_ADJUSTMENTS = np.arange(-3, 4)
+HOUR_ADJUSTMENT_WEIGHTS = np.array([1, 2, 3, 4, 3, 2, 1], dtype=float)
+HOUR_ADJUSTMENT_P = HOUR_ADJUSTMENT_WEIGHTS / HOUR_ADJUSTMENT_WEIGHTS.sum()
 
 fake = Faker()
 
@@ -35,6 +61,10 @@ def get_db_connection():
     """Create database connection."""
     return psycopg2.connect(**DB_CONFIG)
 
+def utc_now():
+    """Current UTC time, naive: timestamps are stored as UTC wall-clock times."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
 def generate_authors(conn, num_authors):
     """Generate author data."""
     cursor = conn.cursor()
@@ -59,19 +89,22 @@ def generate_authors(conn, num_authors):
 def generate_users(conn, num_users):
     """Generate user data."""
     cursor = conn.cursor()
+    rng = np.random.default_rng()
     
     # Clear existing users (keep IDs 501-505 from sample data)
     cursor.execute("DELETE FROM users WHERE user_id > 505")
     
-    for i in range(506, num_users + 506):
-        signup_date = fake.date_between(start_date='-2y', end_date='today')
-        country = random.choice(COUNTRIES)
-        segment = random.choice(USER_SEGMENTS)
-        
-        cursor.execute(
-            "INSERT INTO users (user_id, signup_date, country, user_segment) VALUES (%s, %s, %s, %s)",
-            (i, signup_date, country, segment)
-        )
+    # Signups spread uniformly over the last 2 years
+    today = np.datetime64(utc_now().date(), 'D')
+    signup_date = today - rng.integers(0, 731, num_users).astype('timedelta64[D]')
+    country = rng.choice(COUNTRIES, num_users)
+    segment = rng.choice(USER_SEGMENTS, num_users)
+    
+    copy_rows(
+        conn, 'users',
+        ('user_id', 'signup_date', 'country', 'user_segment'),
+        np.arange(506, num_users + 506), signup_date, country, segment
+    )
     
     conn.commit()
     cursor.close()
@@ -80,122 +113,209 @@ def generate_users(conn, num_users):
 def generate_posts(conn, num_posts):
     """Generate post data with realistic patterns."""
     cursor = conn.cursor()
+    rng = np.random.default_rng()
     
-    # Get author IDs
-    cursor.execute("SELECT author_id FROM authors")
-    author_ids = [row[0] for row in cursor.fetchall()]
+    # Load author IDs and categories once instead of querying per post
+    cursor.execute("SELECT author_id, author_category FROM authors")
+    author_cat_map = dict(cursor.fetchall())
+    author_ids = np.array(list(author_cat_map))
+    author_cats = np.array(list(author_cat_map.values()))
     
     # Clear existing posts (keep IDs 101-103 from sample data)
     cursor.execute("DELETE FROM posts WHERE post_id > 103")
     cursor.execute("DELETE FROM post_metadata WHERE post_id > 103")
     
     # Generate posts with realistic time distribution
-    start_date = datetime.now() - timedelta(days=180)  # Last 6 months
+    start_date = np.datetime64(utc_now() - timedelta(days=180), 'm')  # Last 6 months
     
-    for i in range(104, num_posts + 104):
-        author_id = random.choice(author_ids)
-        
-        # Get author's category, but allow some variation
-        cursor.execute("SELECT author_category FROM authors WHERE author_id = %s", (author_id,))
-        author_cat = cursor.fetchone()[0]
-        category = author_cat if random.random() > 0.2 else random.choice(CATEGORIES)
-        
-        # Realistic publish times (more posts during business hours)
-        hours = random.choices(
-            range(24),
-            weights=[1, 1, 1, 1, 2, 3, 4, 5, 6, 7, 8, 7, 6, 5, 4, 3, 2, 2, 1, 1, 1, 1, 1, 1]
-        )[0]
-        minutes = random.randint(0, 59)
-        
-        publish_date = start_date + timedelta(
-            days=random.randint(0, 180),
-            hours=hours,
-            minutes=minutes
-        )
-        
-        title = fake.sentence(nb_words=6).rstrip('.')
-        content_length = random.randint(500, 3000)
-        has_media = random.random() > 0.4  # 60% have media
-        
-        cursor.execute(
-            """INSERT INTO posts (post_id, author_id, category, publish_timestamp, title, content_length, has_media)
-               VALUES (%s, %s, %s, %s, %s, %s, %s)""",
-            (i, author_id, category, publish_date, title, content_length, has_media)
-        )
-        
-        # Generate metadata
-        num_tags = random.randint(1, 4)
-        tags = [fake.word().capitalize() for _ in range(num_tags)]
-        is_promoted = random.random() > 0.85  # 15% promoted
-        language = 'en'  # Simplified
-        
-        cursor.execute(
-            "INSERT INTO post_metadata (post_id, tags, is_promoted, language) VALUES (%s, %s, %s, %s)",
-            (i, tags, is_promoted, language)
-        )
+    post_ids = np.arange(104, num_posts + 104)
+    author_idx = rng.integers(0, len(author_ids), num_posts)
+    
+    # Use the author's category, but allow some variation
+    category = np.where(
+        rng.random(num_posts) > 0.2,
+        author_cats[author_idx],
+        rng.choice(CATEGORIES, num_posts)
+    )
+    
+    # Realistic publish times (more posts during business hours)
+    hours = rng.choice(24, num_posts, p=PUBLISH_HOUR_P)
+    minutes = rng.integers(0, 60, num_posts)
+    days = rng.integers(0, 181, num_posts)
+    publish_date = start_date + ((days * 24 + hours) * 60 + minutes).astype('timedelta64[m]')
+    
+    titles = [fake.sentence(nb_words=6).rstrip('.') for _ in range(num_posts)]
+    content_length = rng.integers(500, 3001, num_posts)
+    has_media = rng.random(num_posts) > 0.4  # 60% have media
+    
+    copy_rows(
+        conn, 'posts',
+        ('post_id', 'author_id', 'category', 'publish_timestamp', 'title', 'content_length', 'has_media'),
+        post_ids, author_ids[author_idx], category, publish_date,
+        titles, content_length, has_media
+    )
+    
+    # Generate metadata (tags are Postgres arrays, so these go through execute_values)
+    num_tags = rng.integers(1, 5, num_posts)
+    is_promoted = rng.random(num_posts) > 0.85  # 15% promoted
+    language = 'en'  # Simplified
+    metadata_rows = [
+        (post_id, [fake.word().capitalize() for _ in range(tag_count)], promoted, language)
+        for post_id, tag_count, promoted in zip(post_ids.tolist(), num_tags.tolist(), is_promoted.tolist())
+    ]
+    execute_values(
+        cursor,
+        "INSERT INTO post_metadata (post_id, tags, is_promoted, language) VALUES %s",
+        metadata_rows,
+        page_size=PAGE_SIZE
+    )
     
     conn.commit()
     cursor.close()
     print(f"Generated {num_posts} posts")
 
 def generate_engagements(conn, num_engagements):
-    """Generate engagement data with realistic patterns."""
+    """Generate engagement data with realistic patterns, sharded across worker processes."""
     cursor = conn.cursor()
     
     # Get post IDs and publish times
-    cursor.execute("SELECT post_id, publish_timestamp FROM posts")
-    posts = cursor.fetchall()
+    posts = fetch_array(
+        conn, "SELECT post_id, publish_timestamp FROM posts",
+        [('post_id', np.int64), ('publish_timestamp', 'datetime64[us]')]
+    )
+    post_ids = posts['post_id']
+    publish_times = posts['publish_timestamp']
     
     # Get user IDs
-    cursor.execute("SELECT user_id FROM users")
-    user_ids = [row[0] for row in cursor.fetchall()]
+    user_ids = fetch_array(conn, "SELECT user_id FROM users", [('user_id', np.int64)])['user_id']
     
     # Clear existing engagements (keep IDs 2001-2005 from sample data)
     cursor.execute("DELETE FROM engagements WHERE engagement_id > 2005")
     
-    engagement_types = ['view', 'like', 'comment', 'share']
-    # Engagement type distribution (views are most common)
-    type_weights = [0.7, 0.2, 0.07, 0.03]
+    # Drop secondary indexes for the bulk load; rebuilding once is cheaper than maintaining them per row
+    index_defs = drop_secondary_indexes(cursor, 'engagements')
+    conn.commit()
     
-    # Generate engagements with realistic time patterns
-    for i in range(2006, num_engagements + 2006):
-        post_id, publish_time = random.choice(posts)
-        engagement_type = random.choices(engagement_types, weights=type_weights)[0]
-        user_id = random.choice(user_ids) if random.random() > 0.1 else None  # 10% anonymous
-        
-        # Engagement happens after publish, with most happening within first 48 hours
-        hours_after_publish = random.expovariate(0.1)  # Exponential decay
-        hours_after_publish = min(hours_after_publish, 720)  # Cap at 30 days
-        
-        engaged_time = publish_time + timedelta(hours=hours_after_publish)
-        
-        # Add some randomness to hour of day (more engagement during peak hours)
-        hour_adjustment = random.choices(
-            range(-3, 4),
-            weights=[1, 2, 3, 4, 3, 2, 1]
-        )[0]
-        engaged_time = engaged_time + timedelta(hours=hour_adjustment)
-        
-        cursor.execute(
-            """INSERT INTO engagements (engagement_id, post_id, type, user_id, engaged_timestamp)
-               VALUES (%s, %s, %s, %s, %s)""",
-            (i, post_id, engagement_type, user_id, engaged_time)
-        )
-        
-        # Batch commit for performance
-        if i % 1000 == 0:
-            conn.commit()
-            print(f"Generated {i - 2005} engagements...")
+    # Split the ID range into one shard per worker, each with an independent random stream
+    bounds = np.linspace(2006, num_engagements + 2006, NUM_WORKERS + 1).astype(np.int64).tolist()
+    seeds = np.random.SeedSequence().spawn(NUM_WORKERS)
+    shards = [
+        (start, end, seed, post_ids, publish_times, user_ids)
+        for start, end, seed in zip(bounds[:-1], bounds[1:], seeds)
+        if end > start
+    ]
+    try:
+        with Pool(len(shards)) as pool:
+            for count in pool.imap_unordered(seed_engagements_shard, shards):
+                print(f"Generated {count} engagements in a shard...")
+    finally:
+        # Rebuild even if a shard failed, so engagements is never left without its indexes
+        print("Rebuilding engagement indexes...")
+        restore_indexes(cursor, index_defs)
+        conn.commit()
+        cursor.close()
+    print(f"Generated {num_engagements} engagements")
+
+def seed_engagements_shard(shard):
+    """Worker: generate engagement IDs [start, end) and COPY them over its own connection."""
+    start, end, seed, post_ids, publish_times, user_ids = shard
+    rng = np.random.default_rng(seed)
     
-    conn.commit()
+    # Generate every column at once with realistic time patterns
+    n = end - start
+    post_idx = rng.integers(0, len(post_ids), n)
+    types = rng.choice(ENGAGEMENT_TYPES, n, p=ENGAGEMENT_TYPE_P)
+    # 10% anonymous
+    users = np.where(rng.random(n) > 0.1, rng.choice(user_ids, n), None)
+    
+    # Engagement happens after publish, with most happening within first 48 hours
+    hours_after_publish = rng.exponential(10.0, n)  # Exponential decay (rate 0.1)
+    hours_after_publish = np.minimum(hours_after_publish, 720)  # Cap at 30 days
+    
+    # Add some randomness to hour of day (more engagement during peak hours)
+    hour_adjustment = rng.choice(HOUR_ADJUSTMENTS, n, p=HOUR_ADJUSTMENT_P)
+    
+    offset_us = ((hours_after_publish + hour_adjustment) * 3_600_000_000).astype(np.int64)
+    engaged_time = publish_times[post_idx] + offset_us.astype('timedelta64[us]')
+    
+    conn = get_db_connection()
+    try:
+        copy_rows(
+            conn, 'engagements',
+            ('engagement_id', 'post_id', 'type', 'user_id', 'engaged_timestamp'),
+            np.arange(start, end), post_ids[post_idx], types, users, engaged_time
+        )
+        conn.commit()
+    finally:
+        conn.close()
+    return n
+
+def drop_secondary_indexes(cursor, table):
+    """Drop a table's non-unique indexes and return what's needed to rebuild them."""
+    cursor.execute(
+        """SELECT i.indexrelid::regclass::text,
+                  pg_get_indexdef(i.indexrelid),
+                  obj_description(i.indexrelid, 'pg_class')
+           FROM pg_index i
+           WHERE i.indrelid = %s::regclass
+             AND NOT i.indisunique""",
+        (table,)
+    )
+    index_defs = cursor.fetchall()
+    for name, _, _ in index_defs:
+        cursor.execute(f"DROP INDEX {name}")
+    return index_defs
+
+def restore_indexes(cursor, index_defs):
+    """Recreate indexes (and their comments) dropped by drop_secondary_indexes."""
+    for name, definition, comment in index_defs:
+        cursor.execute(definition)
+        if comment is not None:
+            cursor.execute(f"COMMENT ON INDEX {name} IS %s", (comment,))
+
+def fetch_array(conn, query, dtype):
+    """Stream a query through a server-side cursor into a NumPy record array.
+
+    Rows arrive from Postgres in batches of FETCH_ITERSIZE and go straight
+    into the array, so the full result never sits in memory as Python tuples.
+    """
+    with conn.cursor(name='generator_fetch') as cursor:
+        cursor.itersize = FETCH_ITERSIZE
+        cursor.execute(query)
+        return np.fromiter(cursor, dtype=dtype)
+
+def copy_rows(conn, table, columns, *values):
+    """Load column arrays into a table with a single binary COPY FROM STDIN.
+
+    Binary format means Postgres doesn't have to parse text for every value.
+    NumPy datetimes are converted to microseconds so tolist() yields datetime objects.
+    """
+    columns_as_lists = []
+    for column in values:
+        column = np.asarray(column)
+        if np.issubdtype(column.dtype, np.datetime64) and column.dtype != np.dtype('datetime64[D]'):
+            column = column.astype('datetime64[us]')
+        columns_as_lists.append(column.tolist())
+    CopyManager(conn, table, columns).copy(zip(*columns_as_lists))
+
+def vacuum_analyze(conn, tables):
+    """Update planner stats and the visibility map so index-only scans skip the heap."""
+    conn.autocommit = True  # VACUUM can't run inside a transaction
+    cursor = conn.cursor()
+    for table in tables:
+        cursor.execute(f"VACUUM ANALYZE {table}")
     cursor.close()
-    print(f"Generated {num_engagements} engagements")
+    conn.autocommit = False
+    print(f"Vacuumed and analyzed {', '.join(tables)}")
 
 def refresh_materialized_views(conn):
     """Refresh materialized views after data generation."""
     cursor = conn.cursor()
     cursor.execute("REFRESH MATERIALIZED VIEW daily_post_engagement")
     cursor.execute("REFRESH MATERIALIZED VIEW daily_author_engagement")
+    cursor.execute("REFRESH MATERIALIZED VIEW daily_global_engagement")
+    cursor.execute("REFRESH MATERIALIZED VIEW mv_engagement_time_stats")
+    cursor.execute("REFRESH MATERIALIZED VIEW mv_author_post_engagement")
     conn.commit()
     cursor.close()
     print("Refreshed materialized views")
@@ -220,7 +340,10 @@ def main():
         print("\n4. Generating engagements...")
         generate_engagements(conn, NUM_ENGAGEMENTS)
         
-        print("\n5. Refreshing materialized views...")
+        print("\n5. Vacuuming and analyzing...")
+        vacuum_analyze(conn, ['users', 'posts', 'engagements'])
+        
+        print("\n6. Refreshing materialized views...")
         refresh_materialized_views(conn)
         
         conn.close()
@@ -38,4 +38,7 @@ INSERT INTO post_metadata (post_id, tags, is_promoted, language) VALUES
 -- Refresh materialized views after data load
 REFRESH MATERIALIZED VIEW daily_post_engagement;
 REFRESH MATERIALIZED VIEW daily_author_engagement;
+REFRESH MATERIALIZED VIEW daily_global_engagement;
+REFRESH MATERIALIZED VIEW mv_engagement_time_stats;
+REFRESH MATERIALIZED VIEW mv_author_post_engagement;
 
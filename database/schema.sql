@@ -50,13 +50,16 @@ CREATE TABLE engagements (
     post_id INTEGER NOT NULL REFERENCES posts(post_id) ON DELETE CASCADE,
     type VARCHAR(20) NOT NULL CHECK (type IN ('view', 'like', 'comment', 'share')),
     user_id INTEGER REFERENCES users(user_id) ON DELETE SET NULL,
-    engaged_timestamp TIMESTAMP NOT NULL
+    engaged_timestamp TIMESTAMP NOT NULL,
+    -- Day bucket stored with the row so daily rollups can group on a plain indexed column
+    engaged_date DATE GENERATED ALWAYS AS (engaged_timestamp::DATE) STORED
 );
 
 -- Performance Optimizations
 -- 
 -- Indexes for foreign keys (helps with joins)
-CREATE INDEX idx_posts_author_id ON posts(author_id);
+-- post_id is carried in the index so author -> posts joins don't touch the heap
+CREATE INDEX idx_posts_author_id ON posts(author_id) INCLUDE (post_id);
 CREATE INDEX idx_engagements_post_id ON engagements(post_id);
 CREATE INDEX idx_engagements_user_id ON engagements(user_id);
 
@@ -72,12 +75,17 @@ CREATE INDEX idx_posts_category_timestamp ON posts(category, publish_timestamp D
 -- For engagement queries - this one is most important for analytics
 CREATE INDEX idx_engagements_post_type_timestamp ON engagements(post_id, type, engaged_timestamp DESC);
 
--- For time-based analysis
-CREATE INDEX idx_engagements_timestamp ON engagements(engaged_timestamp DESC);
+-- For daily per-post rollups (GROUP BY engaged_date), readable with an index-only scan
+CREATE INDEX idx_engagements_post_date ON engagements(post_id, engaged_date) INCLUDE (type);
 
 -- For filtering by engagement type
 CREATE INDEX idx_engagements_type ON engagements(type);
 
+-- For time-based analysis and "engagements since X" scans joined to posts (top
+-- authors over the last year): the time filter, the type FILTERs and the post_id
+-- join all come from the index
+CREATE INDEX idx_engagements_timestamp_type_post ON engagements(engaged_timestamp, type, post_id);
+
 -- Partitioning Strategy (for scale)
 -- 
 -- For really large datasets (millions of engagements), you can partition by month
@@ -103,33 +111,96 @@ CREATE TABLE engagements_2025_02 PARTITION OF engagements
 -- Daily engagement aggregates by post
 CREATE MATERIALIZED VIEW daily_post_engagement AS
 SELECT 
-    DATE(engaged_timestamp) AS engagement_date,
+    engaged_date AS engagement_date,
     post_id,
     type,
     COUNT(*) AS engagement_count
 FROM engagements
-GROUP BY DATE(engaged_timestamp), post_id, type;
+GROUP BY engaged_date, post_id, type;
 
 CREATE INDEX idx_daily_post_engagement_date ON daily_post_engagement(engagement_date);
-CREATE INDEX idx_daily_post_engagement_post ON daily_post_engagement(post_id);
+-- Unique index: serves post_id + date range lookups and allows REFRESH ... CONCURRENTLY
+CREATE UNIQUE INDEX idx_daily_post_engagement_post_date ON daily_post_engagement(post_id, engagement_date, type);
 
 -- Daily engagement aggregates by author
 CREATE MATERIALIZED VIEW daily_author_engagement AS
 SELECT 
-    DATE(e.engaged_timestamp) AS engagement_date,
+    e.engaged_date AS engagement_date,
     p.author_id,
     e.type,
     COUNT(*) AS engagement_count
 FROM engagements e
 JOIN posts p ON e.post_id = p.post_id
-GROUP BY DATE(e.engaged_timestamp), p.author_id, e.type;
+GROUP BY e.engaged_date, p.author_id, e.type;
 
 CREATE INDEX idx_daily_author_engagement_date ON daily_author_engagement(engagement_date);
-CREATE INDEX idx_daily_author_engagement_author ON daily_author_engagement(author_id);
+-- Unique index: serves author_id + date range lookups and allows REFRESH ... CONCURRENTLY
+CREATE UNIQUE INDEX idx_daily_author_engagement_author_date ON daily_author_engagement(author_id, engagement_date, type);
+
+-- Platform-wide daily rollup (one row per day, used by the analytics summary)
+CREATE MATERIALIZED VIEW daily_global_engagement AS
+SELECT 
+    engaged_date AS engagement_date,
+    COUNT(*) FILTER (WHERE type = 'view') AS views,
+    COUNT(*) FILTER (WHERE type = 'like') AS likes,
+    COUNT(*) FILTER (WHERE type = 'comment') AS comments,
+    COUNT(*) FILTER (WHERE type = 'share') AS shares,
+    COUNT(*) AS total
+FROM engagements
+GROUP BY engaged_date;
+
+CREATE UNIQUE INDEX idx_daily_global_engagement_date ON daily_global_engagement(engagement_date);
+
+-- Engagement counts by day of week x hour of day x type (at most 7*24*4 rows),
+-- used by the time-pattern charts in run_analysis.py instead of scanning engagements
+CREATE MATERIALIZED VIEW mv_engagement_time_stats AS
+SELECT 
+    EXTRACT(DOW FROM engaged_timestamp)::INTEGER AS dow, -- 0=Sunday, 6=Saturday
+    EXTRACT(HOUR FROM engaged_timestamp)::INTEGER AS hour,
+    type,
+    COUNT(*) AS engagement_count
+FROM engagements
+GROUP BY 1, 2, 3;
+
+CREATE UNIQUE INDEX idx_mv_engagement_time_stats_dow_hour ON mv_engagement_time_stats(dow, hour, type);
+
+-- Lifetime engagement counts per post with its author, used by the author
+-- rollups in run_analysis.py instead of joining authors, posts and engagements
+CREATE MATERIALIZED VIEW mv_author_post_engagement AS
+SELECT 
+    a.author_id,
+    a.name,
+    a.author_category,
+    p.post_id,
+    p.publish_timestamp,
+    COUNT(*) FILTER (WHERE e.type = 'view') AS views,
+    COUNT(*) FILTER (WHERE e.type = 'like') AS likes,
+    COUNT(*) FILTER (WHERE e.type = 'comment') AS comments,
+    COUNT(*) FILTER (WHERE e.type = 'share') AS shares,
+    COUNT(e.engagement_id) AS total
+FROM authors a
+JOIN posts p ON a.author_id = p.author_id
+LEFT JOIN engagements e ON p.post_id = e.post_id
+GROUP BY a.author_id, a.name, a.author_category, p.post_id, p.publish_timestamp;
+
+CREATE UNIQUE INDEX idx_mv_author_post_engagement_author_post ON mv_author_post_engagement(author_id, post_id);
+CREATE INDEX idx_mv_author_post_engagement_publish ON mv_author_post_engagement(publish_timestamp);
 
 -- Refresh materialized views after data loads:
 -- REFRESH MATERIALIZED VIEW daily_post_engagement;
 -- REFRESH MATERIALIZED VIEW daily_author_engagement;
+-- REFRESH MATERIALIZED VIEW daily_global_engagement;
+-- REFRESH MATERIALIZED VIEW mv_engagement_time_stats;
+-- REFRESH MATERIALIZED VIEW mv_author_post_engagement;
+-- The API also refreshes the daily views in the background with REFRESH ... CONCURRENTLY
+-- (see MV_REFRESH_SECONDS in api/README.md), so reads are not blocked during a refresh.
+-- The mv_* views are only read by the offline analysis, and run_analysis.py refreshes
+-- them at the start of each run. With pg_cron installed they can also be kept fresh
+-- on a schedule:
+-- SELECT cron.schedule('refresh-engagement-time-stats', '0 * * * *',
+--     'REFRESH MATERIALIZED VIEW CONCURRENTLY mv_engagement_time_stats');
+-- SELECT cron.schedule('refresh-author-post-engagement', '0 3 * * *',
+--     'REFRESH MATERIALIZED VIEW CONCURRENTLY mv_author_post_engagement');
 
 -- Helper Functions
 
@@ -158,6 +229,7 @@ COMMENT ON TABLE post_metadata IS 'Extended post metadata including tags, promot
 COMMENT ON TABLE users IS 'User demographics for segmentation analysis';
 
 COMMENT ON INDEX idx_engagements_post_type_timestamp IS 'Most important index for engagement analytics queries';
+COMMENT ON INDEX idx_engagements_timestamp_type_post IS 'Covering index for time-window engagement aggregates joined to posts';
 COMMENT ON INDEX idx_posts_author_timestamp IS 'Speeds up author performance queries over time';
 COMMENT ON INDEX idx_posts_category_timestamp IS 'Speeds up category trend analysis';
 
@@ -107,5 +107,7 @@ ORDER BY hours_after_publish;
 -- If queries are slow, you can:
 -- - Add computed columns for hour/day and index them
 -- - Use materialized views with pre-computed hour/day
+--   (mv_engagement_time_stats in schema.sql has counts by dow, hour and type;
+--   run_analysis.py reads the hour and heatmap data from it)
 -- - Refresh materialized views hourly for dashboards
 
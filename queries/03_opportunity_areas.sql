@@ -7,7 +7,7 @@
 
 -- Authors: Post Volume vs Engagement Per Post
 -- Finds authors who post a lot but get low engagement per post
-WITH author_stats AS (
+WITH author_stats AS MATERIALIZED (
     SELECT 
         a.author_id,
         a.name,
@@ -218,6 +218,8 @@ ORDER BY post_volume DESC;
 -- 
 -- If you run this query a lot:
 -- - Consider materialized views for opportunity analysis
+-- - author_stats is marked MATERIALIZED so the join + aggregate runs once,
+--   no matter how many times the percentile subqueries read it
 -- - Cache percentile calculations (they can be expensive)
 -- - Pre-compute metrics in a summary table for dashboards
 -- - Could add engagement_score column to posts table if needed
@@ -6,18 +6,22 @@ This executes all the key queries and generates visualizations
 
 import sys
 import os
+import io
+import json
 
 # Add analysis directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'analysis'))
 
 import pandas as pd
-import psycopg2
+from psycopg import sql
 import matplotlib
 matplotlib.use('Agg')  # Use non-interactive backend
 import matplotlib.pyplot as plt
+from matplotlib.transforms import Bbox
 import seaborn as sns
 import numpy as np
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -26,21 +30,288 @@ sns.set_style("whitegrid")
 plt.rcParams['figure.figsize'] = (12, 6)
 
 # Import config
-from config import DB_CONFIG
+from config import DB_URI
+from db import get_connection
 
-# Database connection helper
-def get_db_connection():
-    return psycopg2.connect(**DB_CONFIG)
+# Optional: ADBC returns results as Arrow columns (pip install adbc-driver-postgresql pyarrow)
+try:
+    import adbc_driver_postgresql.dbapi as adbc
+except ImportError:
+    adbc = None
 
-def execute_query(query, connection=None):
-    """Execute SQL query and return DataFrame"""
+def bind_params(query, params=None):
+    """Fill %(name)s placeholders with SQL literals
+    
+    COPY and ADBC can't take bound parameters, so values are quoted
+    client-side with psycopg's adapters instead.
+    """
+    if not params:
+        return query
+    return query % {name: sql.Literal(value).as_string() for name, value in params.items()}
+
+def execute_query(query, connection=None, params=None):
+    """Execute SQL query and return DataFrame
+    
+    Results are streamed with COPY ... TO STDOUT as CSV and parsed by pandas'
+    C reader, so rows never become Python tuples.
+    """
     if connection is None:
-        conn = get_db_connection()
-        df = pd.read_sql_query(query, conn)
-        conn.close()
-        return df
-    else:
-        return pd.read_sql_query(query, connection)
+        with get_connection() as conn:
+            return execute_query(query, conn, params)
+    
+    query = bind_params(query, params).strip().rstrip(';')
+    buf = io.BytesIO()
+    with connection.cursor() as cur:
+        with cur.copy(f"COPY ({query}) TO STDOUT WITH (FORMAT CSV, HEADER)") as copy:
+            for chunk in copy:
+                buf.write(chunk)
+    buf.seek(0)
+    # COPY writes NULL as an empty field; text like 'NA' or 'null' stays a string
+    return pd.read_csv(buf, keep_default_na=False, na_values=[''])
+
+def execute_query_arrow(query, params=None):
+    """Execute SQL query through ADBC and return DataFrame
+    
+    The driver hands back Arrow columns, which convert to NumPy-backed columns
+    without building Python objects. Falls back to execute_query when ADBC
+    isn't installed.
+    """
+    if adbc is None:
+        return execute_query(query, params=params)
+    
+    with adbc.connect(DB_URI) as conn:
+        with conn.cursor() as cur:
+            cur.execute(bind_params(query, params))
+            table = cur.fetch_arrow_table()
+    return table.to_pandas()
+
+# Analysis queries (independent of each other, so main() runs them concurrently).
+# %(cutoff)s is the start of the 365-day window, computed once per run in main().
+
+SUMMARY_QUERY = """
+    SELECT 
+        COUNT(DISTINCT author_id) AS total_authors,
+        COUNT(*) AS total_posts,
+        SUM(total)::BIGINT AS total_engagements,
+        SUM(views)::BIGINT AS total_views,
+        SUM(likes)::BIGINT AS total_likes,
+        SUM(comments)::BIGINT AS total_comments,
+        SUM(shares)::BIGINT AS total_shares,
+        ROUND(SUM(total)::NUMERIC / NULLIF(COUNT(*), 0), 2) AS avg_engagement_per_post
+    FROM mv_author_post_engagement
+    WHERE publish_timestamp >= %(cutoff)s
+"""
+
+# Only the columns the chart and key insights use
+TOP_AUTHORS_QUERY = """
+    SELECT 
+        a.name,
+        COUNT(*) AS total_engagements
+    FROM authors a
+    JOIN posts p ON a.author_id = p.author_id
+    JOIN engagements e ON p.post_id = e.post_id
+    WHERE e.engaged_timestamp >= %(cutoff)s
+    GROUP BY a.author_id, a.name
+    ORDER BY total_engagements DESC
+    LIMIT 20
+"""
+
+HOUR_QUERY = """
+    SELECT 
+        hour AS hour_of_day,
+        SUM(engagement_count)::BIGINT AS total_engagements
+    FROM mv_engagement_time_stats
+    GROUP BY hour
+    ORDER BY hour_of_day
+"""
+
+# Day x hour matrix pivoted in SQL: one row per weekday, one column per hour ("0".."23")
+HEATMAP_QUERY = """
+    SELECT 
+        TO_CHAR(DATE '2024-01-07' + dow, 'FMDay') AS day_of_week, -- 2024-01-07 was a Sunday (dow 0)
+{hour_columns}
+    FROM mv_engagement_time_stats
+    GROUP BY dow
+    ORDER BY dow
+""".format(hour_columns=',\n'.join(
+    f"        COALESCE(SUM(engagement_count) FILTER (WHERE hour = {hour}), 0)::BIGINT AS \"{hour}\""
+    for hour in range(24)
+))
+
+# Averages are DOUBLE PRECISION so they arrive as float64 columns (ADBC returns NUMERIC as text)
+OPPORTUNITY_QUERY = """
+    WITH author_stats AS MATERIALIZED (
+        SELECT 
+            author_id,
+            name,
+            author_category,
+            COUNT(*) AS total_posts,
+            SUM(total)::BIGINT AS total_engagements,
+            ROUND(SUM(total)::NUMERIC / NULLIF(COUNT(*), 0), 2)::DOUBLE PRECISION AS avg_engagement_per_post
+        FROM mv_author_post_engagement
+        WHERE publish_timestamp >= %(cutoff)s
+        GROUP BY author_id, name, author_category
+    ),
+    overall_avg AS (
+        SELECT AVG(avg_engagement_per_post) AS overall_avg_engagement
+        FROM author_stats
+        WHERE total_posts > 0
+    )
+    SELECT 
+        author_stats.author_id,
+        author_stats.name,
+        author_stats.author_category,
+        author_stats.total_posts,
+        author_stats.total_engagements,
+        author_stats.avg_engagement_per_post,
+        oa.overall_avg_engagement
+    FROM author_stats
+    CROSS JOIN overall_avg oa
+    WHERE author_stats.total_posts > 0
+    ORDER BY author_stats.total_posts DESC, author_stats.avg_engagement_per_post ASC
+"""
+
+QUERIES = {
+    'summary': SUMMARY_QUERY,
+    'top_authors': TOP_AUTHORS_QUERY,
+    'hour': HOUR_QUERY,
+    'heatmap': HEATMAP_QUERY,
+    'opportunity': OPPORTUNITY_QUERY,
+}
+
+# Views the analysis queries read instead of the base tables. Nothing else keeps
+# them fresh, so each run refreshes them first (REFRESH_ANALYSIS_VIEWS=0 skips this)
+ANALYSIS_VIEWS = ['mv_engagement_time_stats', 'mv_author_post_engagement']
+REFRESH_ANALYSIS_VIEWS = os.getenv('REFRESH_ANALYSIS_VIEWS', '1') != '0'
+
+# Newest engagement and post, plus a fingerprint of each analysis view (they are
+# refreshed separately from the base tables): if none changed (and the cutoff is
+# the same), a rerun would produce the same output
+CACHE_KEY_QUERY = """
+    SELECT 
+        (SELECT MAX(engaged_timestamp) FROM engagements) AS last_engagement,
+        (SELECT MAX(publish_timestamp) FROM posts) AS last_post,
+        (SELECT COUNT(*) || ':' || COALESCE(SUM(engagement_count), 0)
+         FROM mv_engagement_time_stats) AS time_stats,
+        (SELECT COUNT(*) || ':' || COALESCE(SUM(total), 0)
+         FROM mv_author_post_engagement) AS author_post
+"""
+
+# Bump when the outputs change shape, so keys written by older versions never match
+CACHE_KEY_VERSION = 2
+
+# The opportunity query returns a row per author, so it goes through Arrow
+QUERY_LOADERS = {
+    'opportunity': execute_query_arrow,
+}
+
+# All charts are drawn once into a single 2x2 figure at FIGURE_DPI. Each panel is
+# then cropped out of the rendered pixels, so only PNG encoding runs in the workers.
+FIGURE_DPI = 150
+
+def _draw_top_authors(ax, top_authors):
+    names = top_authors['name'].to_numpy()[:10]
+    counts = top_authors['total_engagements'].to_numpy()[:10]
+    x = np.arange(len(counts))
+    ax.bar(x, counts, width=0.6, color='steelblue')
+    ax.set_xlabel('Author', fontsize=12)
+    ax.set_ylabel('Total Engagements', fontsize=12)
+    ax.set_title('Top Authors by Total Engagement', fontsize=14, fontweight='bold')
+    ax.set_xticks(x)
+    ax.set_xticklabels(names, rotation=45, ha='right')
+    ax.grid(axis='y', alpha=0.3)
+    return [ax]
+
+def _draw_engagement_by_hour(ax, hour_data):
+    ax.plot(hour_data['hour_of_day'], hour_data['total_engagements'], 
+            marker='o', linewidth=2, markersize=8, color='steelblue')
+    ax.fill_between(hour_data['hour_of_day'], hour_data['total_engagements'], 
+                    alpha=0.3, color='steelblue')
+    ax.set_xlabel('Hour of Day', fontsize=12)
+    ax.set_ylabel('Total Engagements', fontsize=12)
+    ax.set_title('Engagement Patterns by Hour of Day', fontsize=14, fontweight='bold')
+    ax.set_xticks(range(0, 24))
+    ax.grid(alpha=0.3)
+    return [ax]
+
+def _draw_engagement_heatmap(ax, heatmap_data):
+    heatmap_pivot = heatmap_data.set_index('day_of_week')
+    
+    sns.heatmap(heatmap_pivot, annot=True, fmt='.0f', cmap='YlOrRd', 
+                cbar_kws={'label': 'Engagement Count'}, ax=ax)
+    ax.set_xlabel('Hour of Day', fontsize=12)
+    ax.set_ylabel('Day of Week', fontsize=12)
+    ax.set_title('Engagement Heatmap: Day of Week vs Hour of Day', fontsize=14, fontweight='bold')
+    # The colorbar has its own axes and belongs to this panel
+    return [ax, ax.collections[0].colorbar.ax]
+
+def _draw_opportunity_scatter(ax, opportunity_data):
+    below_avg = (opportunity_data['avg_engagement_per_post'].to_numpy()
+                 < opportunity_data['overall_avg_engagement'].to_numpy())
+    colors = np.where(below_avg, 'red', 'green')
+    ax.scatter(opportunity_data['total_posts'].to_numpy(), 
+              opportunity_data['avg_engagement_per_post'].to_numpy(),
+              c=colors, alpha=0.6, s=100, edgecolors='black', linewidth=1)
+    avg_engagement = opportunity_data['overall_avg_engagement'].iloc[0]
+    ax.axhline(y=avg_engagement, color='blue', linestyle='--', 
+              label=f'Overall Average ({avg_engagement:.2f})', linewidth=2)
+    ax.set_xlabel('Post Volume (Total Posts)', fontsize=12)
+    ax.set_ylabel('Average Engagement per Post', fontsize=12)
+    ax.set_title('Opportunity Analysis: Post Volume vs Engagement Rate', fontsize=14, fontweight='bold')
+    ax.legend()
+    ax.grid(alpha=0.3)
+    return [ax]
+
+def _crop_panel(pixels, panel_axes, renderer, pad=10):
+    """Cut one panel (axes, labels, ticks and colorbar) out of the rendered figure"""
+    bbox = Bbox.union([panel_ax.get_tightbbox(renderer) for panel_ax in panel_axes])
+    height, width = pixels.shape[:2]
+    # Display coordinates start at the bottom left, image rows at the top
+    x0 = max(int(bbox.x0) - pad, 0)
+    x1 = min(int(np.ceil(bbox.x1)) + pad, width)
+    y0 = max(int(height - bbox.y1) - pad, 0)
+    y1 = min(int(np.ceil(height - bbox.y0)) + pad, height)
+    return pixels[y0:y1, x0:x1]
+
+def _save_png(pixels, viz_dir, file_name):
+    """Encode an RGBA pixel array as PNG (runs in a worker process)"""
+    # zlib level 1: much faster than the default for a slightly larger file
+    plt.imsave(os.path.join(viz_dir, file_name), pixels, dpi=FIGURE_DPI,
+               pil_kwargs={'compress_level': 1})
+    return file_name
+
+def refresh_analysis_views():
+    """Bring the mv_* views up to date without blocking concurrent readers"""
+    with get_connection() as conn:
+        # REFRESH ... CONCURRENTLY can't run inside a transaction block
+        conn.autocommit = True
+        try:
+            for view in ANALYSIS_VIEWS:
+                conn.execute(sql.SQL("REFRESH MATERIALIZED VIEW CONCURRENTLY {}").format(sql.Identifier(view)))
+        finally:
+            conn.autocommit = False
+
+def get_cache_key(params):
+    """Describe the data a run would read, for comparing against the last run"""
+    with get_connection() as conn:
+        last_engagement, last_post, time_stats, author_post = conn.execute(CACHE_KEY_QUERY).fetchone()
+    return {
+        'version': CACHE_KEY_VERSION,
+        'last_engagement': str(last_engagement),
+        'last_post': str(last_post),
+        'mv_engagement_time_stats': time_stats,
+        'mv_author_post_engagement': author_post,
+        'cutoff': str(params['cutoff']),
+    }
+
+def read_cache_key(path):
+    """Key and output files recorded by the last successful run ((None, []) if there isn't one)"""
+    try:
+        with open(path) as f:
+            record = json.load(f)
+        return record['key'], record['files']
+    except (OSError, ValueError, KeyError, TypeError):
+        return None, []
 
 def main():
     print("=" * 60)
@@ -51,194 +322,92 @@ def main():
     viz_dir = os.path.join(os.path.dirname(__file__), 'visualizations')
     os.makedirs(viz_dir, exist_ok=True)
     
-    conn = get_db_connection()
+    # One fixed cutoff for every query, so they all see the same window
+    params = {'cutoff': datetime.now(timezone.utc).date() - timedelta(days=365)}
     
     try:
+        # The views must be current before the key is read, or stale views look unchanged
+        if REFRESH_ANALYSIS_VIEWS:
+            print("\nRefreshing analysis views...")
+            refresh_analysis_views()
+        
+        # Skip the whole run when nothing changed since the last one
+        cache_path = os.path.join(viz_dir, '.cache_key')
+        cache_key = get_cache_key(params)
+        last_key, last_files = read_cache_key(cache_path)
+        outputs_present = all(os.path.exists(os.path.join(viz_dir, name)) for name in last_files)
+        if last_key == cache_key and last_files and outputs_present:
+            print("\nNo new data since the last run, skipping (delete visualizations/.cache_key to force a rerun)")
+            return
+        
+        # Each query runs on its own connection, so Postgres works on them in parallel
+        print("\nRunning queries...")
+        with ThreadPoolExecutor(max_workers=len(QUERIES)) as executor:
+            futures = {
+                name: executor.submit(QUERY_LOADERS.get(name, execute_query), query, params=params)
+                for name, query in QUERIES.items()
+            }
+            results = {name: future.result() for name, future in futures.items()}
+        
+        fig, axes = plt.subplots(2, 2, figsize=(28, 16), dpi=FIGURE_DPI)
+        # (file name, axes making up the panel) for each chart that has data
+        panels = []
+        
         # 1. Executive Summary
         print("\n1. Generating Executive Summary...")
-        summary_query = """
-        SELECT 
-            COUNT(DISTINCT a.author_id) AS total_authors,
-            COUNT(DISTINCT p.post_id) AS total_posts,
-            COUNT(e.engagement_id) AS total_engagements,
-            COUNT(*) FILTER (WHERE e.type = 'view') AS total_views,
-            COUNT(*) FILTER (WHERE e.type = 'like') AS total_likes,
-            COUNT(*) FILTER (WHERE e.type = 'comment') AS total_comments,
-            COUNT(*) FILTER (WHERE e.type = 'share') AS total_shares,
-            ROUND(COUNT(e.engagement_id)::NUMERIC / NULLIF(COUNT(DISTINCT p.post_id), 0), 2) AS avg_engagement_per_post
-        FROM authors a
-        LEFT JOIN posts p ON a.author_id = p.author_id
-        LEFT JOIN engagements e ON p.post_id = e.post_id
-        WHERE p.publish_timestamp >= CURRENT_DATE - INTERVAL '365 days'
-        """
-        summary = execute_query(summary_query, conn)
+        summary = results['summary']
         print("✅ Summary generated")
         print(summary.to_string(index=False))
         
         # 2. Top Authors
         print("\n2. Analyzing Top Authors...")
-        top_authors_query = """
-        SELECT 
-            a.author_id,
-            a.name,
-            a.author_category,
-            COUNT(*) FILTER (WHERE e.type = 'view') AS total_views,
-            COUNT(*) FILTER (WHERE e.type = 'like') AS total_likes,
-            COUNT(*) FILTER (WHERE e.type = 'comment') AS total_comments,
-            COUNT(*) FILTER (WHERE e.type = 'share') AS total_shares,
-            COUNT(*) AS total_engagements,
-            COUNT(DISTINCT e.post_id) AS posts_with_engagement,
-            ROUND(COUNT(*)::NUMERIC / NULLIF(COUNT(DISTINCT e.post_id), 0), 2) AS avg_engagement_per_post
-        FROM authors a
-        JOIN posts p ON a.author_id = p.author_id
-        JOIN engagements e ON p.post_id = e.post_id
-        WHERE e.engaged_timestamp >= CURRENT_DATE - INTERVAL '365 days'
-        GROUP BY a.author_id, a.name, a.author_category
-        ORDER BY total_engagements DESC
-        LIMIT 20
-        """
-        top_authors = execute_query(top_authors_query, conn)
+        top_authors = results['top_authors']
         print(f"✅ Found {len(top_authors)} authors with engagements")
-        
         if len(top_authors) > 0:
-            # Create visualization
-            fig, ax = plt.subplots(figsize=(14, 8))
-            top_10 = top_authors.head(10)
-            x = range(len(top_10))
-            ax.bar(x, top_10['total_engagements'], width=0.6, color='steelblue')
-            ax.set_xlabel('Author', fontsize=12)
-            ax.set_ylabel('Total Engagements', fontsize=12)
-            ax.set_title('Top Authors by Total Engagement', fontsize=14, fontweight='bold')
-            ax.set_xticks(x)
-            ax.set_xticklabels(top_10['name'], rotation=45, ha='right')
-            ax.grid(axis='y', alpha=0.3)
-            plt.tight_layout()
-            plt.savefig(os.path.join(viz_dir, 'top_authors.png'), dpi=300, bbox_inches='tight')
-            plt.close()
-            print("✅ Saved: visualizations/top_authors.png")
+            panels.append(('top_authors.png', _draw_top_authors(axes[0, 0], top_authors)))
         
         # 3. Time Patterns
         print("\n3. Analyzing Time Patterns...")
-        hour_query = """
-        SELECT 
-            EXTRACT(HOUR FROM engaged_timestamp) AS hour_of_day,
-            COUNT(*) AS total_engagements
-        FROM engagements
-        GROUP BY EXTRACT(HOUR FROM engaged_timestamp)
-        ORDER BY hour_of_day
-        """
-        hour_data = execute_query(hour_query, conn)
+        hour_data = results['hour']
         print(f"✅ Found engagement data for {len(hour_data)} hours")
-        
         if len(hour_data) > 0:
-            # Create visualization
-            fig, ax = plt.subplots(figsize=(14, 6))
-            ax.plot(hour_data['hour_of_day'], hour_data['total_engagements'], 
-                    marker='o', linewidth=2, markersize=8, color='steelblue')
-            ax.fill_between(hour_data['hour_of_day'], hour_data['total_engagements'], 
-                            alpha=0.3, color='steelblue')
-            ax.set_xlabel('Hour of Day', fontsize=12)
-            ax.set_ylabel('Total Engagements', fontsize=12)
-            ax.set_title('Engagement Patterns by Hour of Day', fontsize=14, fontweight='bold')
-            ax.set_xticks(range(0, 24))
-            ax.grid(alpha=0.3)
-            plt.tight_layout()
-            plt.savefig(os.path.join(viz_dir, 'engagement_by_hour.png'), dpi=300, bbox_inches='tight')
-            plt.close()
-            print("✅ Saved: visualizations/engagement_by_hour.png")
+            panels.append(('engagement_by_hour.png', _draw_engagement_by_hour(axes[0, 1], hour_data)))
         
         # 4. Heatmap
         print("\n4. Generating Engagement Heatmap...")
-        heatmap_query = """
-        SELECT 
-            EXTRACT(DOW FROM engaged_timestamp) AS day_of_week,
-            EXTRACT(HOUR FROM engaged_timestamp) AS hour_of_day,
-            COUNT(*) AS engagement_count
-        FROM engagements
-        GROUP BY EXTRACT(DOW FROM engaged_timestamp), EXTRACT(HOUR FROM engaged_timestamp)
-        ORDER BY day_of_week, hour_of_day
-        """
-        heatmap_data = execute_query(heatmap_query, conn)
-        
+        heatmap_data = results['heatmap']
         if len(heatmap_data) > 0:
-            heatmap_pivot = heatmap_data.pivot(index='day_of_week', columns='hour_of_day', values='engagement_count').fillna(0)
-            day_names = ['Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday']
-            heatmap_pivot.index = [day_names[int(i)] for i in heatmap_pivot.index]
-            
-            fig, ax = plt.subplots(figsize=(16, 8))
-            sns.heatmap(heatmap_pivot, annot=True, fmt='.0f', cmap='YlOrRd', 
-                        cbar_kws={'label': 'Engagement Count'}, ax=ax)
-            ax.set_xlabel('Hour of Day', fontsize=12)
-            ax.set_ylabel('Day of Week', fontsize=12)
-            ax.set_title('Engagement Heatmap: Day of Week vs Hour of Day', fontsize=14, fontweight='bold')
-            plt.tight_layout()
-            plt.savefig(os.path.join(viz_dir, 'engagement_heatmap.png'), dpi=300, bbox_inches='tight')
-            plt.close()
-            print("✅ Saved: visualizations/engagement_heatmap.png")
+            panels.append(('engagement_heatmap.png', _draw_engagement_heatmap(axes[1, 0], heatmap_data)))
         
         # 5. Opportunity Analysis
         print("\n5. Analyzing Opportunities...")
-        opportunity_query = """
-        WITH author_stats AS (
-            SELECT 
-                a.author_id,
-                a.name,
-                a.author_category,
-                COUNT(DISTINCT p.post_id) AS total_posts,
-                COUNT(e.engagement_id) AS total_engagements,
-                ROUND(COUNT(e.engagement_id)::NUMERIC / NULLIF(COUNT(DISTINCT p.post_id), 0), 2) AS avg_engagement_per_post
-            FROM authors a
-            LEFT JOIN posts p ON a.author_id = p.author_id
-            LEFT JOIN engagements e ON p.post_id = e.post_id
-            WHERE p.publish_timestamp >= CURRENT_DATE - INTERVAL '365 days'
-            GROUP BY a.author_id, a.name, a.author_category
-        ),
-        overall_avg AS (
-            SELECT AVG(avg_engagement_per_post) AS overall_avg_engagement
-            FROM author_stats
-            WHERE total_posts > 0
-        )
-        SELECT 
-            author_stats.author_id,
-            author_stats.name,
-            author_stats.author_category,
-            author_stats.total_posts,
-            author_stats.total_engagements,
-            author_stats.avg_engagement_per_post,
-            oa.overall_avg_engagement
-        FROM author_stats
-        CROSS JOIN overall_avg oa
-        WHERE author_stats.total_posts > 0
-        ORDER BY author_stats.total_posts DESC, author_stats.avg_engagement_per_post ASC
-        """
-        opportunity_data = execute_query(opportunity_query, conn)
+        opportunity_data = results['opportunity']
         print(f"✅ Analyzed {len(opportunity_data)} authors")
-        
         if len(opportunity_data) > 0:
-            # Create scatter plot
-            fig, ax = plt.subplots(figsize=(14, 8))
-            colors = []
-            for _, row in opportunity_data.iterrows():
-                if row['avg_engagement_per_post'] < row['overall_avg_engagement']:
-                    colors.append('red')
-                else:
-                    colors.append('green')
-            ax.scatter(opportunity_data['total_posts'], 
-                      opportunity_data['avg_engagement_per_post'],
-                      c=colors, alpha=0.6, s=100, edgecolors='black', linewidth=1)
-            if len(opportunity_data) > 0:
-                avg_engagement = opportunity_data['overall_avg_engagement'].iloc[0]
-                ax.axhline(y=avg_engagement, color='blue', linestyle='--', 
-                          label=f'Overall Average ({avg_engagement:.2f})', linewidth=2)
-            ax.set_xlabel('Post Volume (Total Posts)', fontsize=12)
-            ax.set_ylabel('Average Engagement per Post', fontsize=12)
-            ax.set_title('Opportunity Analysis: Post Volume vs Engagement Rate', fontsize=14, fontweight='bold')
-            ax.legend()
-            ax.grid(alpha=0.3)
-            plt.tight_layout()
-            plt.savefig(os.path.join(viz_dir, 'opportunity_scatter.png'), dpi=300, bbox_inches='tight')
-            plt.close()
-            print("✅ Saved: visualizations/opportunity_scatter.png")
+            panels.append(('opportunity_scatter.png', _draw_opportunity_scatter(axes[1, 1], opportunity_data)))
+        
+        # Rasterize the whole dashboard once
+        print("\nRendering visualizations...")
+        for ax in axes.flat:
+            if not ax.has_data():
+                ax.set_visible(False)
+        fig.tight_layout()
+        fig.canvas.draw()
+        renderer = fig.canvas.get_renderer()
+        pixels = np.asarray(fig.canvas.buffer_rgba())
+        images = [('analysis_dashboard.png', pixels)]
+        images += [(file_name, _crop_panel(pixels, panel_axes, renderer)) for file_name, panel_axes in panels]
+        plt.close(fig)
+        
+        # PNG encoding is CPU-bound, so each file is written in its own process
+        with ProcessPoolExecutor(max_workers=len(images)) as plot_pool:
+            saves = [plot_pool.submit(_save_png, image, viz_dir, file_name) for file_name, image in images]
+            wait(saves)
+            for save in saves:
+                print(f"✅ Saved: visualizations/{save.result()}")
+        
+        with open(cache_path, 'w') as f:
+            json.dump({'key': cache_key, 'files': [file_name for file_name, _ in images]}, f)
         
         print("\n" + "=" * 60)
         print("✅ Analysis Complete!")
@@ -246,19 +415,20 @@ def main():
         print(f"\nGenerated visualizations in: {viz_dir}")
         print("\nKey Insights:")
         if len(top_authors) > 0:
-            print(f"  - Top author: {top_authors.iloc[0]['name']} with {top_authors.iloc[0]['total_engagements']} engagements")
+            # Rows are already sorted by total engagements
+            names = top_authors['name'].to_numpy()
+            engagements = top_authors['total_engagements'].to_numpy()
+            print(f"  - Top author: {names[0]} with {engagements[0]} engagements")
         if len(hour_data) > 0:
-            peak_hour = hour_data.loc[hour_data['total_engagements'].idxmax(), 'hour_of_day']
-            print(f"  - Peak engagement hour: {int(peak_hour)}:00")
+            hours = hour_data['hour_of_day'].to_numpy()
+            counts = hour_data['total_engagements'].to_numpy()
+            print(f"  - Peak engagement hour: {int(hours[counts.argmax()])}:00")
         print("\nSee recommendations/recommendations.md for detailed recommendations")
         
     except Exception as e:
         print(f"\n❌ Error during analysis: {e}")
         import traceback
         traceback.print_exc()
-    finally:
-        conn.close()
 
 if __name__ == "__main__":
     main()
-
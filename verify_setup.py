@@ -9,17 +9,31 @@ import os
 # Add analysis directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'analysis'))
 
-def test_database_connection():
+def open_connection():
+    """Borrow the pooled connection shared by the database tests (None if it fails)"""
+    try:
+        from db import POOL
+        
+        POOL.open()
+        conn = POOL.getconn()
+        # Read-only checks: autocommit keeps one failed query from aborting the rest
+        conn.autocommit = True
+        return conn
+    except Exception as e:
+        print(f"❌ Could not connect to the database: {e}\n")
+        return None
+
+def test_database_connection(conn):
     """Test database connection and basic queries"""
     print("=" * 60)
     print("1. Testing Database Connection")
     print("=" * 60)
     
+    if conn is None:
+        print("❌ Database connection failed")
+        return False
+    
     try:
-        import psycopg2
-        from analysis.config import DB_CONFIG
-        
-        conn = psycopg2.connect(**DB_CONFIG)
         cur = conn.cursor()
         
         # Test basic query
@@ -38,24 +52,24 @@ def test_database_connection():
         engagement_count = cur.fetchone()[0]
         print(f"   Total engagements: {engagement_count}")
         
-        conn.close()
+        cur.close()
         return True
     except Exception as e:
         print(f"❌ Database connection failed: {e}")
         return False
 
-def test_pandas_integration():
+def test_pandas_integration(conn):
     """Test pandas with PostgreSQL"""
     print("\n" + "=" * 60)
     print("2. Testing Pandas Integration")
     print("=" * 60)
     
+    if conn is None:
+        print("❌ Skipped: no database connection")
+        return False
+    
     try:
         import pandas as pd
-        import psycopg2
-        from analysis.config import DB_CONFIG
-        
-        conn = psycopg2.connect(**DB_CONFIG)
         
         query = """
         SELECT 
@@ -75,7 +89,6 @@ def test_pandas_integration():
         print("\n   Sample data:")
         print(df.to_string(index=False))
         
-        conn.close()
         return True
     except Exception as e:
         print(f"❌ Pandas integration failed: {e}")
@@ -99,17 +112,17 @@ def test_visualization_libraries():
         print(f"❌ Missing visualization library: {e}")
         return False
 
-def test_sql_queries():
+def test_sql_queries(conn):
     """Test SQL query files"""
     print("\n" + "=" * 60)
     print("4. Testing SQL Queries")
     print("=" * 60)
     
+    if conn is None:
+        print("❌ Skipped: no database connection")
+        return False
+    
     try:
-        import psycopg2
-        from analysis.config import DB_CONFIG
-        
-        conn = psycopg2.connect(**DB_CONFIG)
         cur = conn.cursor()
         
         # Test time pattern query
@@ -127,7 +140,7 @@ def test_sql_queries():
         print(f"✅ SQL query execution successful")
         print(f"   Found engagement data for {len(results)} hours")
         
-        conn.close()
+        cur.close()
         return True
     except Exception as e:
         print(f"❌ SQL query test failed: {e}")
@@ -158,12 +171,20 @@ def main():
     print("Jumper Media Analytics - Setup Verification")
     print("=" * 60 + "\n")
     
+    # One connection for all database tests instead of one per test
+    conn = open_connection()
+    
     results = []
-    results.append(("Database Connection", test_database_connection()))
-    results.append(("Pandas Integration", test_pandas_integration()))
-    results.append(("Visualization Libraries", test_visualization_libraries()))
-    results.append(("SQL Queries", test_sql_queries()))
-    results.append(("API Dependencies", test_api_imports()))
+    try:
+        results.append(("Database Connection", test_database_connection(conn)))
+        results.append(("Pandas Integration", test_pandas_integration(conn)))
+        results.append(("Visualization Libraries", test_visualization_libraries()))
+        results.append(("SQL Queries", test_sql_queries(conn)))
+        results.append(("API Dependencies", test_api_imports()))
+    finally:
+        if conn is not None:
+            from db import POOL
+            POOL.putconn(conn)
     
     print("\n" + "=" * 60)
     print("Summary")